@@ -5,7 +5,15 @@ Implementación basada en principios SOLID y Clean Code
 
 from pyscript import document
 import math
-import random
+
+import numpy as np
+
+# Numba es opcional: PyScript (Pyodide) no lo incluye
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 
 # ============================================================================
@@ -15,9 +23,15 @@ import random
 class RunsTestResult:
     """Encapsula los resultados de la prueba de corridas"""
     
-    def __init__(self, sequence, c0, n0, n1, n, mu_c0, variance, sigma_c0, 
-                 z0, z_critical, is_independent, alpha, confidence):
-        self.sequence = sequence
+    __slots__ = ('data', 'c0', 'n0', 'n1', 'n', 'mu_c0', 'variance',
+                 'sigma_c0', 'z0', 'z_critical', 'is_independent', 'alpha',
+                 'confidence', '_sequence')
+    
+    def __init__(self, data, c0, n0, n1, n, mu_c0, variance, sigma_c0, 
+                 z0, z_critical, is_independent, alpha, confidence,
+                 sequence=None):
+        self.data = data
+        self._sequence = sequence
         self.c0 = c0
         self.n0 = n0
         self.n1 = n1
@@ -30,29 +44,69 @@ class RunsTestResult:
         self.is_independent = is_independent
         self.alpha = alpha
         self.confidence = confidence
+    
+    @property
+    def sequence(self):
+        """
+        Secuencia binaria de los datos. Si la prueba no la construyó
+        (conteo con Numba), se genera la primera vez que se consulta.
+        """
+        if self._sequence is None:
+            self._sequence = _generate_sequence(self.data)
+        return self._sequence
 
 
 # ============================================================================
 # SERVICIOS (Single Responsibility Principle)
 # ============================================================================
 
+# Las operaciones del camino crítico de la prueba son funciones de módulo:
+# RunsTestService.execute las invoca directamente, sin resolver atributos,
+# y las clases de servicio las exponen como métodos estáticos.
+
+_THRESHOLD = 0.5
+
+
+def _generate_sequence(data):
+    """
+    Genera una secuencia de 0s y 1s comparando cada valor con el umbral.
+    
+    Args:
+        data: Lista o arreglo de números a convertir
+        
+    Returns:
+        Arreglo numpy (uint8) de 0s y 1s según la comparación
+    """
+    values = np.asarray(data, dtype=np.float64)
+    return np.greater_equal(values, _THRESHOLD).view(np.uint8)
+
+
 class SequenceGenerator:
     """Responsable de generar secuencias binarias"""
     
-    THRESHOLD = 0.5
+    THRESHOLD = _THRESHOLD
     
-    @staticmethod
-    def generate(data):
-        """
-        Genera una secuencia de 0s y 1s comparando cada valor con el umbral.
+    generate = staticmethod(_generate_sequence)
+
+
+def _analyze_sequence(sequence):
+    """
+    Cuenta corridas, 0s y 1s de la secuencia en una sola llamada.
+    
+    Args:
+        sequence: Secuencia binaria
         
-        Args:
-            data: Lista de números a convertir
-            
-        Returns:
-            Lista de 0s y 1s según la comparación
-        """
-        return [0 if value < SequenceGenerator.THRESHOLD else 1 for value in data]
+    Returns:
+        Tupla (número de corridas, cantidad de 0s, cantidad de 1s)
+    """
+    sequence = np.asarray(sequence, dtype=np.uint8)
+    n = len(sequence)
+    if n == 0:
+        return 0, 0, 0
+    
+    n1 = int(sequence.sum())
+    runs = 1 + int(np.count_nonzero(sequence[1:] != sequence[:-1]))
+    return runs, n - n1, n1
 
 
 class RunsCounter:
@@ -70,15 +124,11 @@ class RunsCounter:
         Returns:
             Número de corridas
         """
-        if not sequence:
+        sequence = np.asarray(sequence, dtype=np.uint8)
+        if len(sequence) == 0:
             return 0
         
-        runs = 1
-        for i in range(1, len(sequence)):
-            if sequence[i] != sequence[i - 1]:
-                runs += 1
-        
-        return runs
+        return 1 + int(np.count_nonzero(sequence[1:] != sequence[:-1]))
     
     @staticmethod
     def count_values(sequence):
@@ -91,9 +141,75 @@ class RunsCounter:
         Returns:
             Tupla (cantidad de 0s, cantidad de 1s)
         """
-        n0 = sequence.count(0)
-        n1 = sequence.count(1)
+        sequence = np.asarray(sequence, dtype=np.uint8)
+        n1 = int(sequence.sum())
+        n0 = len(sequence) - n1
         return n0, n1
+    
+    analyze = staticmethod(_analyze_sequence)
+
+
+def _runs_kernel(data, threshold):
+    """
+    Cuenta corridas, 0s y 1s recorriendo los datos una sola vez,
+    sin construir la secuencia binaria intermedia.
+    
+    Args:
+        data: Arreglo numpy (float64) de números a analizar
+        threshold: Umbral de comparación
+        
+    Returns:
+        Tupla (número de corridas, cantidad de 0s, cantidad de 1s)
+    """
+    n = data.shape[0]
+    if n == 0:
+        return 0, 0, 0
+    
+    prev = 1 if data[0] >= threshold else 0
+    n1 = prev
+    runs = 1
+    for i in range(1, n):
+        bit = 1 if data[i] >= threshold else 0
+        n1 += bit
+        if bit != prev:
+            runs += 1
+        prev = bit
+    
+    return runs, n - n1, n1
+
+
+if NUMBA_AVAILABLE:
+    _runs_kernel = njit(cache=True)(_runs_kernel)
+
+
+def _standardize(c0, mu_c0, variance):
+    """
+    Calcula σ_C0 y Z0 a partir de la media y la varianza.
+    
+    Returns:
+        Tupla (σ_C0, Z0); ambos 0 si la varianza no es positiva
+    """
+    if variance <= 0:
+        return 0, 0
+    
+    sigma_c0 = math.sqrt(variance)
+    return sigma_c0, (c0 - mu_c0) / sigma_c0
+
+
+def _compute_statistics(c0, n0, n1, n):
+    """
+    Calcula todos los estadísticos de la prueba en una sola llamada,
+    con una única raíz cuadrada.
+    
+    Returns:
+        Tupla (μ_C0, σ²_C0, σ_C0, Z0)
+    """
+    p = 2 * n0 * n1
+    mu_c0 = p / n + 0.5
+    variance = p * (p - n) / (n * n * (n - 1)) if n > 1 else 0
+    
+    sigma_c0, z0 = _standardize(c0, mu_c0, variance)
+    return mu_c0, variance, sigma_c0, z0
 
 
 class StatisticsCalculator:
@@ -105,7 +221,7 @@ class StatisticsCalculator:
         Calcula el valor esperado del número de corridas (μ_C0).
         Formula: μ_C0 = (2*n0*n1)/n + 1/2
         """
-        return (2 * n0 * n1) / n + 0.5
+        return _compute_statistics(0, n0, n1, n)[0]
     
     @staticmethod
     def calculate_variance(n0, n1, n):
@@ -113,13 +229,7 @@ class StatisticsCalculator:
         Calcula la varianza del número de corridas (σ²_C0).
         Formula: σ²_C0 = [2*n0*n1 * (2*n0*n1 - n)] / [n² * (n-1)]
         """
-        if n <= 1:
-            return 0
-        
-        numerator = 2 * n0 * n1 * (2 * n0 * n1 - n)
-        denominator = n * n * (n - 1)
-        
-        return numerator / denominator if denominator != 0 else 0
+        return _compute_statistics(0, n0, n1, n)[1]
     
     @staticmethod
     def calculate_z_statistic(c0, mu_c0, variance):
@@ -127,11 +237,9 @@ class StatisticsCalculator:
         Calcula el estadístico Z0.
         Formula: Z0 = (C0 - μ_C0) / σ_C0
         """
-        if variance <= 0:
-            return 0
-        
-        sigma_c0 = math.sqrt(variance)
-        return (c0 - mu_c0) / sigma_c0
+        return _standardize(c0, mu_c0, variance)[1]
+    
+    compute_all = staticmethod(_compute_statistics)
 
 
 class CriticalValueProvider:
@@ -156,7 +264,12 @@ class CriticalValueProvider:
         Returns:
             Valor crítico Z_α/2
         """
-        return cls.Z_TABLE.get(alpha, cls.Z_TABLE[cls.DEFAULT_ALPHA])
+        return _Z_TABLE_GET(alpha, _Z_DEFAULT)
+
+
+# Búsqueda precalculada para evitar resolver la tabla en cada prueba
+_Z_TABLE_GET = CriticalValueProvider.Z_TABLE.get
+_Z_DEFAULT = CriticalValueProvider.Z_TABLE[CriticalValueProvider.DEFAULT_ALPHA]
 
 
 class HypothesisValidator:
@@ -188,6 +301,7 @@ class RunsTestService:
     """
     
     def __init__(self):
+        # Se conservan solo por compatibilidad; execute usa las funciones de módulo
         self.sequence_generator = SequenceGenerator()
         self.runs_counter = RunsCounter()
         self.stats_calculator = StatisticsCalculator()
@@ -205,28 +319,28 @@ class RunsTestService:
         Returns:
             Objeto RunsTestResult con todos los resultados
         """
-        # Generar secuencia
-        sequence = self.sequence_generator.generate(data)
-        
-        # Contar corridas y valores
-        c0 = self.runs_counter.count(sequence)
-        n0, n1 = self.runs_counter.count_values(sequence)
         n = len(data)
         
+        # Contar corridas y valores; con Numba no se construye la secuencia
+        if NUMBA_AVAILABLE:
+            values = np.asarray(data, dtype=np.float64)
+            c0, n0, n1 = _runs_kernel(values, _THRESHOLD)
+            sequence = None
+        else:
+            sequence = _generate_sequence(data)
+            c0, n0, n1 = _analyze_sequence(sequence)
+        
         # Calcular estadísticos
-        mu_c0 = self.stats_calculator.calculate_expected_runs(n0, n1, n)
-        variance = self.stats_calculator.calculate_variance(n0, n1, n)
-        sigma_c0 = math.sqrt(variance) if variance > 0 else 0
-        z0 = self.stats_calculator.calculate_z_statistic(c0, mu_c0, variance)
+        mu_c0, variance, sigma_c0, z0 = _compute_statistics(c0, n0, n1, n)
         
         # Obtener valor crítico
-        z_critical = self.critical_value_provider.get_critical_value(alpha)
+        z_critical = _Z_TABLE_GET(alpha, _Z_DEFAULT)
         
         # Validar hipótesis
-        is_independent = self.hypothesis_validator.validate(z0, z_critical)
+        is_independent = -z_critical <= z0 <= z_critical
         
         return RunsTestResult(
-            sequence=sequence,
+            data=data,
             c0=c0,
             n0=n0,
             n1=n1,
@@ -238,7 +352,8 @@ class RunsTestService:
             z_critical=z_critical,
             is_independent=is_independent,
             alpha=alpha,
-            confidence=(1 - alpha) * 100
+            confidence=(1 - alpha) * 100,
+            sequence=sequence
         )
 
 
@@ -246,83 +361,97 @@ class RunsTestService:
 # CAPA DE PRESENTACIÓN (Separation of Concerns)
 # ============================================================================
 
+# Plantilla fija de la tabla de estadísticos: (criterio, descripción, valor)
+_STATISTICS_ROWS = (
+    ("n (Tamaño de muestra)", 
+     "Cantidad total de números en el conjunto", 
+     "{n}"),
+    ("n₀ (Cantidad de ceros)", 
+     "Números menores que 0.5 en la secuencia", 
+     "{n0}"),
+    ("n₁ (Cantidad de unos)", 
+     "Números mayores o iguales a 0.5 en la secuencia", 
+     "{n1}"),
+    ("C₀ (Número de corridas)", 
+     "Cantidad de secuencias de 0s o 1s consecutivos", 
+     "{c0}"),
+    ("μ_C₀ (Valor esperado)", 
+     "Valor esperado del número de corridas", 
+     "{mu_c0:.4f}"),
+    ("σ²_C₀ (Varianza)", 
+     "Varianza del número de corridas", 
+     "{variance:.6f}"),
+    ("σ_C₀ (Desviación estándar)", 
+     "Raíz cuadrada de la varianza", 
+     "{sigma_c0:.6f}"),
+    ("Z₀ (Estadístico)", 
+     "Estadístico calculado para la prueba", 
+     "{z0:.4f}"),
+    ("±Z_α/2 (Valor crítico)", 
+     "Valor crítico para α={alpha} ({confidence:.0f}% confianza)", 
+     "±{z_critical}")
+)
+
+_STATISTICS_TABLE_TEMPLATE = "".join(
+    f"<tr><td><strong>{criterion}</strong></td><td>{description}</td><td>{value}</td></tr>"
+    for criterion, description, value in _STATISTICS_ROWS
+)
+
+
 class ResultsPresenter:
     """Responsable de presentar los resultados en la interfaz HTML"""
     
-    @staticmethod
-    def show_results_section():
+    def __init__(self):
+        # Se consultan una sola vez; las referencias se reutilizan en cada prueba
+        self.results_section = document.querySelector("#results")
+        self.input_table = document.querySelector("#input-table")
+        self.sequence_div = document.querySelector("#sequence")
+        self.results_body = document.querySelector("#results-body")
+        self.validation_div = document.querySelector("#validation")
+    
+    def show_results_section(self):
         """Muestra la sección de resultados"""
-        results_section = document.querySelector("#results")
-        results_section.classList.add("show")
+        self.results_section.classList.add("show")
     
-    @staticmethod
-    def display_input_data(data):
+    def display_input_data(self, data):
         """Muestra los datos de entrada en una tabla"""
-        input_table = document.querySelector("#input-table")
-        html = "<thead><tr><th>Índice</th><th>Valor</th></tr></thead><tbody>"
-        
-        for i, value in enumerate(data, 1):
-            html += f"<tr><td>{i}</td><td>{value:.3f}</td></tr>"
-        
-        html += "</tbody>"
-        input_table.innerHTML = html
+        rows = "".join(
+            f"<tr><td>{i}</td><td>{value:.3f}</td></tr>"
+            for i, value in enumerate(data, 1)
+        )
+        self.input_table.innerHTML = (
+            "<thead><tr><th>Índice</th><th>Valor</th></tr></thead>"
+            f"<tbody>{rows}</tbody>"
+        )
     
-    @staticmethod
-    def display_sequence(sequence):
+    def display_sequence(self, sequence):
         """Muestra la secuencia binaria"""
-        sequence_div = document.querySelector("#sequence")
-        sequence_str = "{" + ",".join(map(str, sequence)) + "}"
-        sequence_div.innerHTML = f"S = {sequence_str}"
+        # Los dígitos se obtienen sumando ord("0") a cada byte, sin str() por elemento
+        digits = (np.asarray(sequence, dtype=np.uint8) + ord("0")).tobytes().decode()
+        sequence_str = "{" + ",".join(digits) + "}"
+        self.sequence_div.innerHTML = f"S = {sequence_str}"
     
-    @staticmethod
-    def display_statistics_table(result):
+    def display_statistics_table(self, result):
         """Muestra la tabla con los estadísticos calculados"""
-        results_body = document.querySelector("#results-body")
-        
-        rows_data = [
-            ("n (Tamaño de muestra)", 
-             "Cantidad total de números en el conjunto", 
-             result.n),
-            ("n₀ (Cantidad de ceros)", 
-             "Números menores que 0.5 en la secuencia", 
-             result.n0),
-            ("n₁ (Cantidad de unos)", 
-             "Números mayores o iguales a 0.5 en la secuencia", 
-             result.n1),
-            ("C₀ (Número de corridas)", 
-             "Cantidad de secuencias de 0s o 1s consecutivos", 
-             result.c0),
-            ("μ_C₀ (Valor esperado)", 
-             "Valor esperado del número de corridas", 
-             f"{result.mu_c0:.4f}"),
-            ("σ²_C₀ (Varianza)", 
-             "Varianza del número de corridas", 
-             f"{result.variance:.6f}"),
-            ("σ_C₀ (Desviación estándar)", 
-             "Raíz cuadrada de la varianza", 
-             f"{result.sigma_c0:.6f}"),
-            ("Z₀ (Estadístico)", 
-             "Estadístico calculado para la prueba", 
-             f"{result.z0:.4f}"),
-            ("±Z_α/2 (Valor crítico)", 
-             f"Valor crítico para α={result.alpha} ({result.confidence:.0f}% confianza)", 
-             f"±{result.z_critical}")
-        ]
-        
-        html = ""
-        for criterion, description, value in rows_data:
-            html += f"<tr><td><strong>{criterion}</strong></td><td>{description}</td><td>{value}</td></tr>"
-        
-        results_body.innerHTML = html
+        self.results_body.innerHTML = _STATISTICS_TABLE_TEMPLATE.format(
+            n=result.n,
+            n0=result.n0,
+            n1=result.n1,
+            c0=result.c0,
+            mu_c0=result.mu_c0,
+            variance=result.variance,
+            sigma_c0=result.sigma_c0,
+            z0=result.z0,
+            z_critical=result.z_critical,
+            alpha=result.alpha,
+            confidence=result.confidence
+        )
     
-    @staticmethod
-    def display_validation(result):
+    def display_validation(self, result):
         """Muestra el resultado de la validación"""
-        validation_div = document.querySelector("#validation")
-        
         if result.is_independent:
-            validation_div.className = "validation pass"
-            validation_div.innerHTML = f"""
+            self.validation_div.className = "validation pass"
+            self.validation_div.innerHTML = f"""
                 ✅ <strong>PRUEBA APROBADA</strong><br>
                 Como {result.z0:.4f} está dentro del intervalo 
                 [{-result.z_critical}, {result.z_critical}],<br>
@@ -331,8 +460,8 @@ class ResultsPresenter:
                 con un nivel de confianza del {result.confidence:.0f}%.
             """
         else:
-            validation_div.className = "validation fail"
-            validation_div.innerHTML = f"""
+            self.validation_div.className = "validation fail"
+            self.validation_div.innerHTML = f"""
                 ❌ <strong>PRUEBA RECHAZADA</strong><br>
                 Como {result.z0:.4f} está fuera del intervalo 
                 [{-result.z_critical}, {result.z_critical}],<br>
@@ -341,14 +470,22 @@ class ResultsPresenter:
                 con un nivel de confianza del {result.confidence:.0f}%.
             """
     
-    @classmethod
-    def present_all(cls, result, data):
+    def present_all(self, result, data):
         """Presenta todos los resultados"""
-        cls.show_results_section()
-        cls.display_input_data(data)
-        cls.display_sequence(result.sequence)
-        cls.display_statistics_table(result)
-        cls.display_validation(result)
+        self.show_results_section()
+        self.display_input_data(data)
+        self.display_sequence(result.sequence)
+        self.display_statistics_table(result)
+        self.display_validation(result)
+    
+    def clear(self):
+        """Oculta la sección de resultados y borra su contenido"""
+        self.results_section.classList.remove("show")
+        self.input_table.innerHTML = ""
+        self.sequence_div.innerHTML = ""
+        self.results_body.innerHTML = ""
+        self.validation_div.className = "validation"
+        self.validation_div.innerHTML = ""
 
 
 # ============================================================================
@@ -361,23 +498,26 @@ class DataParser:
     @staticmethod
     def parse(data_input):
         """
-        Convierte una cadena de texto en una lista de números flotantes.
+        Convierte una cadena de texto en un arreglo de números flotantes.
         
         Args:
             data_input: Cadena con números separados por comas o espacios
             
         Returns:
-            Lista de números flotantes
+            Arreglo numpy (float64) de números
             
         Raises:
             ValueError: Si los datos no son válidos
         """
         data_str = data_input.replace(',', ' ').split()
-        data = [float(x) for x in data_str if x.strip()]
+        data = np.array(data_str, dtype=np.float64)
         
-        if not data:
+        if data.size == 0:
             raise ValueError("No se encontraron números válidos en la entrada")
         
+        if not np.isfinite(data).all():
+            raise ValueError("Los datos contienen valores no finitos (nan o inf)")
+        
         return data
 
 
@@ -387,8 +527,7 @@ class UIController:
     def __init__(self):
         self.test_service = RunsTestService()
         self.presenter = ResultsPresenter()
-        self.parser = DataParser()
-        self._rng = random.Random()
+        self._rng = np.random.default_rng()
     
     def handle_test_execution(self, event):
         """
@@ -410,7 +549,7 @@ class UIController:
                 return
             
             # Parsear datos
-            data = self.parser.parse(data_input)
+            data = DataParser.parse(data_input)
             
             # Ejecutar prueba
             result = self.test_service.execute(data, alpha_input)
@@ -448,8 +587,8 @@ class UIController:
             if decimals < 0 or decimals > 10:
                 self._show_error("Los decimales deben estar entre 0 y 10")
                 return
-            values = [self._rng.random() for _ in range(n)]
-            text = ", ".join(f"{v:.{decimals}f}" for v in values)
+            values = self._rng.random(n)
+            text = ", ".join(map(f"{{:.{decimals}f}}".format, values.tolist()))
             document.querySelector("#data-input").value = text
         except Exception as e:
             self._show_error(f"No se pudieron generar los datos: {str(e)}")
@@ -463,20 +602,7 @@ class UIController:
                 data_area.value = ""
 
             # Ocultar y limpiar resultados
-            res_section = document.querySelector("#results")
-            if res_section:
-                res_section.classList.remove("show")
-
-            tbl_input = document.querySelector("#input-table")
-            seq_div = document.querySelector("#sequence")
-            tbl_body = document.querySelector("#results-body")
-            validation = document.querySelector("#validation")
-            if tbl_input: tbl_input.innerHTML = ""
-            if seq_div: seq_div.innerHTML = ""
-            if tbl_body: tbl_body.innerHTML = ""
-            if validation:
-                validation.className = "validation"
-                validation.innerHTML = ""
+            self.presenter.clear()
         except Exception as e:
             self._show_error(f"No se pudo limpiar: {str(e)}")
 